@@ -15,44 +15,127 @@ import asyncio
 import socket
 import subprocess
 import threading
+import multiprocessing as mp
 import json
+import collections
 import csv
 from datetime import datetime
 from dataclasses import dataclass, asdict, field
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterator
 from pathlib import Path
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import time
+import struct
+from array import array
 import re
+from itertools import compress, islice
 import platform
 import sys
+import os
+
+try:
+    import orjson  # optional, faster JSON export
+except ImportError:
+    orjson = None
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+try:
+    import uvloop  # optional, faster event loop (not on Windows)
+except ImportError:
+    uvloop = None
 
 # ================================================================================
 # LOGGING CONFIGURATION
 # ================================================================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('scanner_v5.2.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+# Records go through a queue; formatting and file/console writes happen on
+# a background listener thread so the scan loop never blocks on log I/O.
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('scanner_v5.2.log', encoding='utf-8'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread"""
+    
+    def prepare(self, record):
+        # In-process queue: no pickling, so the record can go as-is
+        return record
+
+
+_log_queue = queue.Queue(-1)
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(_DeferredQueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
+# Local adb server (smart socket protocol)
+ADB_SERVER_ADDR = ('127.0.0.1', 5037)
+ADB_PORTS = frozenset((5037, 5555))
+
+# SO_LINGER {on, 0s}: close() sends RST instead of FIN
+LINGER_RST = struct.pack('ii', 1, 0)
+
+# Adaptive concurrency: the limit starts at the threads setting and is
+# re-tuned every ADAPT_WINDOW * limit completions (at least ADAPT_MIN_WINDOW)
+ADAPT_WINDOW = 2
+ADAPT_MIN_WINDOW = 32
+# Back off when the timeout rate rises by this factor (and by at least
+# ADAPT_TIMEOUT_SLACK), grow while throughput holds within ADAPT_RATE_NOISE
+ADAPT_TIMEOUT_RISE = 1.5
+ADAPT_TIMEOUT_SLACK = 0.1
+ADAPT_RATE_NOISE = 0.9
+
+# Pre-sweep: preferred port for the per-host TCP check (when it is in the
+# scan's port list, else the list's first port), hosts checked per batch
+SWEEP_PORT = 5555
+SWEEP_BATCH = 1024
+
+# Minimum seconds between [PROGRESS] notifications
+NOTIFY_INTERVAL = 0.1
+
+# Device type ids used by ADBScanner's hit columns
+DEVICE_TYPES = ("ADB", "SSH", "Telnet", "Unknown")
+
+# Service banner grabbed right after connect
+BANNER_SIZE = 64
+BANNER_TIMEOUT = 0.3
+
+# Write buffer for export files (bytes)
+EXPORT_BUFFER = 64 * 1024
+
+# One custom port token: "5555" or "20-25"
+PORT_SPEC_RE = re.compile(r'\s*(\d+)(?:\s*-\s*(\d+))?\s*')
+
+# Columns written by ADBScanner.export_csv
+CSV_FIELDS = ('ip', 'port', 'device_type', 'status', 'device_id', 'timestamp')
+
 # ================================================================================
 # VALIDATION FUNCTIONS
 # ================================================================================
 
 def validate_ip(ip: str) -> bool:
-    """Validate IP address format"""
-    pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-    if not re.match(pattern, ip):
+    """Validate IP address format (strict dotted quad, parsed in C)"""
+    try:
+        socket.inet_pton(socket.AF_INET, ip)
+        return True
+    except OSError:
         return False
-    parts = ip.split('.')
-    return all(0 <= int(p) <= 255 for p in parts)
 
 def validate_port(port: int) -> bool:
     """Validate port number"""
@@ -66,7 +149,7 @@ def validate_threads(threads: int) -> bool:
 # DATA CLASSES
 # ================================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ScanSettings:
     """Settings for scanning"""
     # IP ranges
@@ -92,6 +175,7 @@ class ScanSettings:
     # Optimization
     skip_ping: bool = False
     use_async: bool = True
+    pre_sweep: bool = True  # check each host once before probing all ports (needs ping)
     
     # Profile
     profile: str = "balanced"  # lightning, quick, balanced, deep, paranoid
@@ -118,18 +202,28 @@ class ScanSettings:
         return asdict(self)
 
 
+# Profile presets: name -> (threads, timeout, port_end)
+SCAN_PROFILES = {
+    "lightning": (200, 0.3, 5555),
+    "quick": (100, 0.5, 5555),
+    "balanced": (50, 1.0, 5555),
+    "deep": (30, 2.0, 65535),
+    "paranoid": (10, 5.0, 65535),
+}
+
+
 @dataclass
 class DeviceInfo:
     """Device information"""
     ip: str
     port: int
-    device_type: str  # "ADB", "SSH", "Telnet", "Unknown"
+    device_type: str  # one of DEVICE_TYPES
     status: str  # "online", "offline", "unknown"
     device_id: str = ""
     manufacturer: str = ""
     model: str = ""
     version: str = ""
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = ""  # set once per scan by ADBScanner.scan_async
     
     def to_dict(self):
         return asdict(self)
@@ -146,77 +240,148 @@ class ScanResult:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
+# ================================================================================
+# NETWORK HELPERS
+# ================================================================================
+
+def new_probe_socket() -> socket.socket:
+    """Non-blocking TCP socket whose close() sends RST (no TIME_WAIT)"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RST)
+    return sock
+
+def recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes from socket"""
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed by peer")
+        data += chunk
+    return data
+
+def new_scan_loop() -> asyncio.AbstractEventLoop:
+    """Event loop for the scan thread (uvloop if installed)"""
+    if uvloop is not None and sys.platform != 'win32':
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+def fd_limited_concurrency(threads: int) -> int:
+    """Cap concurrent probes at half the open-file limit (one socket each)"""
+    if resource is None:  # Windows
+        return threads
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return threads
+    return max(1, min(threads, soft // 2))
+
 # ================================================================================
 # IP ADDRESS GENERATOR
 # ================================================================================
 
-def ip_to_tuple(ip: str) -> Tuple[int, int, int, int]:
-    """Convert IP to tuple of integers"""
-    try:
-        return tuple(map(int, ip.split('.')))
-    except:
-        return (0, 0, 0, 0)
+def ip_to_int(ip: str) -> int:
+    """Convert IP to 32-bit integer"""
+    return int.from_bytes(socket.inet_pton(socket.AF_INET, ip), 'big')
 
-def generate_ip_range(ip_start: str, ip_end: str) -> List[str]:
-    """Generate list of IP addresses in range"""
-    try:
-        # Validate IPs
-        if not validate_ip(ip_start) or not validate_ip(ip_end):
-            logger.error(f"Invalid IP range: {ip_start} - {ip_end}")
-            return []
-        
-        start = ip_to_tuple(ip_start)
-        end = ip_to_tuple(ip_end)
-        
-        ips = []
-        current = list(start)
-        
-        while tuple(current) <= end:
-            ips.append('.'.join(map(str, current)))
-            # Increment
-            current[3] += 1
-            if current[3] > 255:
-                current[3] = 0
-                current[2] += 1
-                if current[2] > 255:
-                    current[2] = 0
-                    current[1] += 1
-                    if current[1] > 255:
-                        current[1] = 0
-                        current[0] += 1
-        
-        return ips
-    except Exception as e:
-        logger.error(f"Error generating IP range: {e}")
-        return []
+def ip_range_size(ip_start: str, ip_end: str) -> int:
+    """Number of IP addresses in range (0 if invalid or empty)"""
+    if not validate_ip(ip_start) or not validate_ip(ip_end):
+        return 0
+    return max(0, ip_to_int(ip_end) - ip_to_int(ip_start) + 1)
+
+def generate_ip_range(ip_start: str, ip_end: str) -> Iterator[str]:
+    """Lazily generate IP addresses in range (raises OSError on invalid IP)"""
+    for n in range(ip_to_int(ip_start), ip_to_int(ip_end) + 1):
+        yield socket.inet_ntoa(n.to_bytes(4, 'big'))
 
-def parse_ports(port_string: str, port_start: int, port_end: int) -> List[int]:
-    """Parse ports from string and range"""
-    ports = set()
+def parse_ports(port_string: str, port_start: int, port_end: int) -> array:
+    """Parse ports from string and range into a sorted array of unique ports"""
+    # Bitmap indexed by port number: dedupes and sorts for free
+    bitmap = bytearray(65536)
     
     # Add port range
-    if validate_port(port_start) and validate_port(port_end):
-        for p in range(port_start, port_end + 1):
-            ports.add(p)
+    if validate_port(port_start) and validate_port(port_end) and port_start <= port_end:
+        bitmap[port_start:port_end + 1] = b'\x01' * (port_end - port_start + 1)
     
-    # Parse custom ports
-    try:
-        for p_str in port_string.split(','):
-            p_str = p_str.strip()
-            if '-' in p_str:
-                parts = p_str.split('-')
-                if len(parts) == 2:
-                    p1, p2 = int(parts[0]), int(parts[1])
-                    if validate_port(p1) and validate_port(p2) and p1 <= p2:
-                        ports.update(range(p1, p2 + 1))
-            else:
-                p = int(p_str)
-                if validate_port(p):
-                    ports.add(p)
-    except ValueError:
-        logger.warning(f"Invalid port specification: {port_string}")
+    # Parse custom ports ("5037", "20-25", comma separated)
+    for p_str in port_string.split(','):
+        m = PORT_SPEC_RE.fullmatch(p_str)
+        if m is None:
+            if p_str.strip():
+                logger.warning(f"Invalid port specification: {p_str.strip()}")
+            continue
+        p1 = int(m[1])
+        p2 = int(m[2]) if m[2] else p1
+        if validate_port(p1) and validate_port(p2) and p1 <= p2:
+            bitmap[p1:p2 + 1] = b'\x01' * (p2 - p1 + 1)
+    
+    return array('H', compress(range(65536), bitmap))
+
+# ================================================================================
+# ADAPTIVE CONCURRENCY
+# ================================================================================
+
+class AdaptiveLimiter:
+    """Async concurrency limit tuned from probe throughput and timeout rate"""
     
-    return sorted(list(ports))
+    def __init__(self, cap: int, initial: Optional[int] = None):
+        self.cap = max(1, cap)
+        self.limit = self.cap if initial is None else min(initial, self.cap)
+        self._sem = asyncio.Semaphore(self.limit)
+        self._debt = 0  # permits to swallow after shrinking
+        
+        self._completed = 0
+        self._timeouts_seen = 0
+        self._window_start = time.monotonic()
+        # Baselines, seeded from the first window: a scan of mostly dead
+        # hosts times out a lot from the start, that alone is no saturation
+        self._last_rate = None
+        self._last_timeout_rate = None
+    
+    async def __aenter__(self):
+        await self._sem.acquire()
+    
+    async def __aexit__(self, *exc):
+        if self._debt:
+            self._debt -= 1
+        else:
+            self._sem.release()
+    
+    def update(self, completed: int, timeouts_total: int):
+        """Account finished probes; re-tune once per window of completions"""
+        self._completed += completed
+        if self._completed < max(ADAPT_MIN_WINDOW, ADAPT_WINDOW * self.limit):
+            return
+        
+        now = time.monotonic()
+        rate = self._completed / max(now - self._window_start, 1e-6)
+        timeout_rate = (timeouts_total - self._timeouts_seen) / self._completed
+        
+        if self._last_rate is None:
+            pass
+        elif timeout_rate > max(self._last_timeout_rate * ADAPT_TIMEOUT_RISE,
+                                self._last_timeout_rate + ADAPT_TIMEOUT_SLACK):
+            # Timeouts rising: network or target is saturated, back off
+            shrink = self.limit - max(1, self.limit // 2)
+            self.limit -= shrink
+            self._debt += shrink
+        elif rate >= self._last_rate * ADAPT_RATE_NOISE and self.limit < self.cap:
+            # Throughput holding up with more concurrency: grow
+            grow = min(self.limit * 2, self.cap) - self.limit
+            self.limit += grow
+            for _ in range(grow):
+                if self._debt:
+                    self._debt -= 1
+                else:
+                    self._sem.release()
+        
+        self._last_rate = rate
+        self._last_timeout_rate = timeout_rate
+        self._timeouts_seen = timeouts_total
+        self._completed = 0
+        self._window_start = now
+
 
 # ================================================================================
 # ADB SCANNER CLASS
@@ -227,122 +392,251 @@ class ADBScanner:
     
     def __init__(self):
         self.is_scanning = False
-        self.devices_found: Dict[str, DeviceInfo] = {}
+        self._hits = self._new_hits()
         self.callback = None
         self.scan_result = ScanResult()
+        self._ping_cache: Dict[str, asyncio.Future] = {}
+        self._adb_lock = threading.Lock()
+        self._adb_server_started = False
+        self._last_notify = 0.0
+        self._probe_timeouts = 0
+    
+    @staticmethod
+    def _new_hits() -> Dict:
+        """Found devices as columns (struct of arrays)"""
+        return {'ip': array('I'), 'port': array('H'), 'type': bytearray()}
+    
+    def _record_hit(self, ip: str, port: int, device_type: str):
+        """Append one found device to the hit columns"""
+        self._hits['ip'].append(ip_to_int(ip))
+        self._hits['port'].append(port)
+        self._hits['type'].append(DEVICE_TYPES.index(device_type))
+    
+    def _hits_to_devices(self, timestamp: str) -> List[DeviceInfo]:
+        """Materialize DeviceInfo objects from the hit columns"""
+        return [
+            DeviceInfo(
+                ip=socket.inet_ntoa(ip.to_bytes(4, 'big')),
+                port=port,
+                device_type=DEVICE_TYPES[type_id],
+                status="online",
+                timestamp=timestamp
+            )
+            for ip, port, type_id in zip(self._hits['ip'], self._hits['port'], self._hits['type'])
+        ]
     
     def set_callback(self, callback):
         """Set callback for updates"""
         self.callback = callback
     
-    def _notify(self, message: str, progress: float = None, devices: int = None):
+    def _notify(self, message: str, progress: float = None, devices: int = None,
+                hit: Optional[DeviceInfo] = None):
         """Send notification"""
         if self.callback:
-            self.callback(message=message, progress=progress, devices=devices)
+            self.callback(message=message, progress=progress, devices=devices, hit=hit)
     
-    def _check_port(self, ip: str, port: int, timeout: float = 1.0) -> bool:
-        """Check if port is open"""
+    async def _probe_port(self, ip: str, port: int, timeout: float = 1.0,
+                          read_banner: bool = True) -> Optional[bytes]:
+        """Connect to port; return banner (b'' if none) or None if closed"""
+        loop = asyncio.get_running_loop()
+        sock = new_probe_socket()
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((ip, port))
+            try:
+                await asyncio.wait_for(loop.sock_connect(sock, (ip, port)), timeout)
+            except asyncio.TimeoutError:
+                self._probe_timeouts += 1
+                return None
+            except OSError:
+                return None
+            
+            if not read_banner:
+                return b''
+            try:
+                return await asyncio.wait_for(loop.sock_recv(sock, BANNER_SIZE), BANNER_TIMEOUT)
+            except (OSError, asyncio.TimeoutError):
+                return b''
+        finally:
             sock.close()
-            return result == 0
-        except:
+    
+    async def _tcp_ping(self, ip: str, port: int, timeout: float) -> bool:
+        """Check host is up: port open or actively refused (RST) both count"""
+        loop = asyncio.get_running_loop()
+        sock = new_probe_socket()
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (ip, port)), timeout)
+            return True
+        except ConnectionRefusedError:
+            return True
+        except asyncio.TimeoutError:
+            self._probe_timeouts += 1
+            return False
+        except OSError:
             return False
+        finally:
+            sock.close()
+    
+    async def _alive_sweep(self, ips: Iterator[str], ip_count: int, port: int,
+                           timeout: float, concurrency: int) -> List[str]:
+        """One reachability check per IP (TCP, then ping), return hosts that answered"""
+        # Own limiter: the sweep's timeout profile (dead hosts) differs from
+        # the port scan's, so it must not seed the scan limiter's baselines
+        limiter = AdaptiveLimiter(concurrency)
+        checked = 0
+        
+        async def check(ip: str) -> Optional[str]:
+            nonlocal checked
+            async with limiter:
+                if not self.is_scanning:
+                    return None
+                alive = await self._tcp_ping(ip, port, timeout) or await self._host_alive(ip)
+            
+            checked += 1
+            limiter.update(1, self._probe_timeouts)
+            now = time.monotonic()
+            if now - self._last_notify >= NOTIFY_INTERVAL:
+                self._last_notify = now
+                self._notify(
+                    f"[SWEEP] {checked}/{ip_count} hosts "
+                    f"(concurrency {limiter.limit})",
+                    progress=checked / ip_count * 100
+                )
+            return ip if alive else None
+        
+        alive = []
+        while self.is_scanning:
+            batch = list(islice(ips, SWEEP_BATCH))
+            if not batch:
+                break
+            for ip in await asyncio.gather(*(check(ip) for ip in batch)):
+                if ip:
+                    alive.append(ip)
+        return alive
     
-    def _ping_host(self, ip: str) -> bool:
+    async def _ping_host(self, ip: str) -> bool:
         """Ping host (cross-platform, NO shell injection)"""
+        # Windows: ping -n 1 -w 500
+        # Unix: ping -c 1 -W 500
+        if platform.system() == 'Windows':
+            cmd = ['ping', '-n', '1', '-w', '500', ip]
+        else:
+            cmd = ['ping', '-c', '1', '-W', '500', ip]
+        
+        # Async subprocess: waiting on a ping holds no thread
         try:
-            # Windows: ping -n 1 -w 500
-            # Unix: ping -c 1 -W 500
-            if platform.system() == 'Windows':
-                cmd = ['ping', '-n', '1', '-w', '500', ip]
-            else:
-                cmd = ['ping', '-c', '1', '-W', '500', ip]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=2,
-                check=False
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
             )
-            return result.returncode == 0
         except Exception as e:
             logger.debug(f"Ping failed for {ip}: {e}")
             return False
+        try:
+            return await asyncio.wait_for(proc.wait(), 2) == 0
+        except asyncio.TimeoutError:
+            logger.debug(f"Ping timed out for {ip}")
+            return False
+        finally:
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
     
-    def _identify_device(self, ip: str, port: int) -> Optional[DeviceInfo]:
-        """Identify device type"""
-        
-        # Check ADB
-        if port in [5037, 5555]:
+    async def _host_alive(self, ip: str) -> bool:
+        """Ping host at most once per scan, shared by all its port probes"""
+        fut = self._ping_cache.get(ip)
+        if fut is None:
+            fut = asyncio.ensure_future(self._ping_host(ip))
+            self._ping_cache[ip] = fut
+        # Shield: cancelling one probe must not cancel the shared ping
+        return await asyncio.shield(fut)
+    
+    def _adb_transact(self, cmd: str, timeout: float = 2.0) -> bytes:
+        """Send one host request to the local adb server, return its reply"""
+        # The server serves a single host request per connection, so a
+        # localhost socket is opened per call (no adb client fork/exec).
+        with socket.create_connection(ADB_SERVER_ADDR, timeout=timeout) as sock:
+            sock.sendall(f"{len(cmd):04x}{cmd}".encode())
+            status = recv_exact(sock, 4)
+            length = int(recv_exact(sock, 4), 16)
+            payload = recv_exact(sock, length)
+        if status != b'OKAY':
+            raise RuntimeError(f"adb server: {payload.decode(errors='replace')}")
+        return payload
+    
+    def _start_adb_server(self):
+        """Start adb server once per scanner (NO shell=True)"""
+        with self._adb_lock:
+            if self._adb_server_started:
+                return
+            self._adb_server_started = True
             try:
-                result = subprocess.run(
-                    ['adb', 'connect', f'{ip}:{port}'],
+                subprocess.run(
+                    ['adb', 'start-server'],
                     capture_output=True,
-                    timeout=2,
-                    text=True,
+                    timeout=10,
                     check=False
                 )
-                if 'connected' in result.stdout.lower() or result.returncode == 0:
-                    return DeviceInfo(
-                        ip=ip,
-                        port=port,
-                        device_type="ADB",
-                        status="online"
-                    )
             except Exception as e:
-                logger.debug(f"ADB check failed: {e}")
+                logger.warning(f"Could not start adb server: {e}")
+    
+    def _adb_connect(self, ip: str, port: int) -> bool:
+        """Ask adb server to connect (blocking, executed in a worker thread)"""
+        cmd = f"host:connect:{ip}:{port}"
+        try:
+            try:
+                reply = self._adb_transact(cmd)
+            except ConnectionRefusedError:
+                self._start_adb_server()
+                reply = self._adb_transact(cmd)
+            return b'connected' in reply.lower()
+        except Exception as e:
+            logger.debug(f"ADB check failed: {e}")
+            return False
+    
+    async def _identify_device(self, ip: str, port: int, executor: ThreadPoolExecutor,
+                               banner: bytes) -> str:
+        """Identify device type from banner, falling back to port number"""
+        # Check ADB
+        if port in ADB_PORTS:
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(executor, self._adb_connect, ip, port):
+                return "ADB"
         
-        # Check SSH
+        # SSH / Telnet by banner, then by port number
+        if banner.startswith(b'SSH-'):
+            return "SSH"
+        if banner[:1] == b'\xff':  # Telnet IAC
+            return "Telnet"
         if port == 22:
-            if self._check_port(ip, port, timeout=0.5):
-                return DeviceInfo(
-                    ip=ip,
-                    port=port,
-                    device_type="SSH",
-                    status="online"
-                )
-        
-        # Check Telnet
+            return "SSH"
         if port == 23:
-            if self._check_port(ip, port, timeout=0.5):
-                return DeviceInfo(
-                    ip=ip,
-                    port=port,
-                    device_type="Telnet",
-                    status="online"
-                )
-        
-        # Unknown
-        if self._check_port(ip, port, timeout=0.5):
-            return DeviceInfo(
-                ip=ip,
-                port=port,
-                device_type="Unknown",
-                status="online"
-            )
-        
-        return None
+            return "Telnet"
+        return "Unknown"
     
-    def _scan_single_target(self, ip: str, port: int, settings: ScanSettings) -> Optional[DeviceInfo]:
-        """Scan single target"""
+    async def _scan_single_target(self, ip: str, port: int, skip_ping: bool, timeout: float,
+                                  read_banners: bool,
+                                  executor: ThreadPoolExecutor) -> Optional[str]:
+        """Scan single target, return device type if found"""
         
-        # Ping check (NO shell=True, secure)
-        if not settings.skip_ping:
-            if not self._ping_host(ip):
+        # Ping check (NO shell=True, secure), once per IP
+        if not skip_ping:
+            if not await self._host_alive(ip):
                 return None
         
-        # Check port
-        if not self._check_port(ip, port, timeout=settings.timeout):
+        # Check port, grab banner (ADB ports never talk first)
+        banner = await self._probe_port(ip, port, timeout=timeout,
+                                        read_banner=read_banners and port not in ADB_PORTS)
+        if banner is None:
             return None
         
         # Identify
-        return self._identify_device(ip, port)
+        return await self._identify_device(ip, port, executor, banner)
     
     async def scan_async(self, settings: ScanSettings):
-        """Async multi-threaded scanning"""
+        """Async scanning on a single event loop"""
         
         # Validate settings FIRST
         is_valid, error_msg = settings.validate()
@@ -357,77 +651,143 @@ class ADBScanner:
             logger.warning("Thread count capped at 200")
         
         self.is_scanning = True
-        self.devices_found = {}
+        self._hits = self._new_hits()
+        self._ping_cache = {}
+        self._last_notify = 0.0
+        self._probe_timeouts = 0
         start_time = time.time()
         
         try:
             # Generate targets
-            ips = generate_ip_range(settings.ip_start, settings.ip_end)
+            ip_count = ip_range_size(settings.ip_start, settings.ip_end)
             ports = parse_ports(settings.custom_ports, settings.port_start, settings.port_end)
             
-            if not ips or not ports:
+            if not ip_count or not ports:
                 self._notify("[ERROR] No valid IPs or ports to scan")
                 return
             
-            targets = [(ip, port) for ip in ips for port in ports]
-            total_targets = len(targets)
+            # Async scanning: all probes share one event loop. Concurrency
+            # is auto-tuned, with the threads setting as the upper bound.
+            # Pings are async subprocesses; only the blocking adb connect
+            # goes to a small executor.
+            scanned = 0
+            scan_ts = datetime.now().isoformat()
+            concurrency = fd_limited_concurrency(settings.threads)
+            limiter = AdaptiveLimiter(concurrency)
             
-            self._notify(f"[SCAN START] {total_targets} targets")
-            logger.info(f"Scanning: {len(ips)} IPs * {len(ports)} ports = {total_targets} targets")
+            # Resolve settings once, not per probe. Lightning profile skips
+            # banner reads and classifies by port number only.
+            skip_ping = settings.skip_ping
+            timeout = settings.timeout
+            read_banners = settings.profile != "lightning"
             
-            # Multi-threaded scanning
-            scanned = 0
-            with ThreadPoolExecutor(max_workers=settings.threads) as executor:
-                futures = {
-                    executor.submit(self._scan_single_target, ip, port, settings): (ip, port)
-                    for ip, port in targets
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                
+                ips = generate_ip_range(settings.ip_start, settings.ip_end)
+                
+                # Pre-sweep: one check per IP, then fan the port list out
+                # to live hosts only (pointless with a single port). Needs
+                # ping as fallback: with ping skipped, a host that drops SYNs
+                # to the sweep port would lose all its other ports too.
+                if settings.pre_sweep and not skip_ping and len(ports) > 1:
+                    sweep_port = SWEEP_PORT if SWEEP_PORT in ports else ports[0]
+                    self._notify(f"[SWEEP] Checking {ip_count} hosts")
+                    alive = await self._alive_sweep(ips, ip_count, sweep_port,
+                                                    timeout, concurrency)
+                    self._notify(f"[SWEEP] {len(alive)}/{ip_count} hosts alive")
+                    logger.info(f"Sweep: {len(alive)}/{ip_count} hosts alive")
+                    ips = iter(alive)
+                    ip_count = len(alive)
+                    skip_ping = True  # liveness already established
+                    self._probe_timeouts = 0
+                
+                targets = ((ip, port) for ip in ips for port in ports)
+                total_targets = ip_count * len(ports)
+                
+                self._notify(f"[SCAN START] {total_targets} targets")
+                logger.info(f"Scanning: {ip_count} IPs * {len(ports)} ports = {total_targets} targets")
+                
+                async def guarded(ip: str, port: int) -> Tuple[str, int, Optional[str]]:
+                    async with limiter:
+                        if not self.is_scanning:
+                            return ip, port, None
+                        return ip, port, await self._scan_single_target(
+                            ip, port, skip_ping, timeout, read_banners, executor
+                        )
+                
+                # Sliding window: keep at most 2 * max concurrency tasks alive
+                # so memory stays O(threads), not O(IPs * ports)
+                window = 2 * concurrency
+                pending = {
+                    asyncio.create_task(guarded(ip, port))
+                    for ip, port in islice(targets, window)
                 }
                 
-                for future in as_completed(futures):
-                    if not self.is_scanning:
-                        break
-                    
-                    try:
-                        device = future.result(timeout=settings.timeout + 2)
-                        scanned += 1
+                try:
+                    while pending and self.is_scanning:
+                        # Timeout doubles as a heartbeat for stop_scan()
+                        done, pending = await asyncio.wait(
+                            pending, timeout=1.0, return_when=asyncio.FIRST_COMPLETED
+                        )
                         
-                        if device:
-                            key = f"{device.ip}:{device.port}"
-                            self.devices_found[key] = device
-                            self._notify(
-                                f"[FOUND] {device.ip}:{device.port} ({device.device_type})",
-                                progress=scanned / total_targets * 100,
-                                devices=len(self.devices_found)
-                            )
-                            logger.info(f"Device: {key} ({device.device_type})")
-                        else:
-                            if scanned % 10 == 0:
-                                self._notify(
-                                    f"[PROGRESS] {scanned}/{total_targets}",
-                                    progress=scanned / total_targets * 100
-                                )
-                    
-                    except Exception as e:
-                        logger.error(f"Scan error: {e}")
-                        scanned += 1
+                        for task in done:
+                            try:
+                                ip, port, device_type = task.result()
+                                scanned += 1
+                                
+                                if device_type:
+                                    self._record_hit(ip, port, device_type)
+                                    self._notify(
+                                        f"[FOUND] {ip}:{port} ({device_type})",
+                                        progress=scanned / total_targets * 100,
+                                        devices=len(self._hits['port']),
+                                        hit=DeviceInfo(ip=ip, port=port, device_type=device_type,
+                                                       status="online", timestamp=scan_ts)
+                                    )
+                                    logger.info("Device: %s:%d (%s)", ip, port, device_type)
+                                else:
+                                    # Progress is rate-limited, hits are always sent
+                                    now = time.monotonic()
+                                    if now - self._last_notify >= NOTIFY_INTERVAL:
+                                        self._last_notify = now
+                                        self._notify(
+                                            f"[PROGRESS] {scanned}/{total_targets} "
+                                            f"(concurrency {limiter.limit})",
+                                            progress=scanned / total_targets * 100
+                                        )
+                            
+                            except Exception as e:
+                                logger.error(f"Scan error: {e}")
+                                scanned += 1
+                        
+                        limiter.update(len(done), self._probe_timeouts)
+                        
+                        # Refill the window
+                        for ip, port in islice(targets, len(done)):
+                            pending.add(asyncio.create_task(guarded(ip, port)))
+                finally:
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
             
             scan_time = time.time() - start_time
+            found = len(self._hits['port'])
             
             # Save results
             self.scan_result = ScanResult(
-                devices=list(self.devices_found.values()),
+                devices=self._hits_to_devices(scan_ts),
                 total_scanned=scanned,
-                total_found=len(self.devices_found),
+                total_found=found,
                 scan_time=scan_time,
                 settings=settings
             )
             
             self._notify(
-                f"[COMPLETE] Found {len(self.devices_found)} devices in {scan_time:.1f}s",
+                f"[COMPLETE] Found {found} devices in {scan_time:.1f}s",
                 progress=100,
-                devices=len(self.devices_found)
+                devices=found
             )
-            logger.info(f"Result: {len(self.devices_found)} devices, {scan_time:.1f}s")
+            logger.info(f"Result: {found} devices, {scan_time:.1f}s")
         
         except Exception as e:
             self._notify(f"[ERROR] {str(e)}")
@@ -444,17 +804,26 @@ class ADBScanner:
     def export_json(self, path: str):
         """Export to JSON"""
         try:
-            data = {
-                'devices': [d.to_dict() for d in self.scan_result.devices],
-                'stats': {
-                    'found': self.scan_result.total_found,
-                    'scanned': self.scan_result.total_scanned,
-                    'time': self.scan_result.scan_time,
-                    'timestamp': self.scan_result.timestamp
-                }
+            stats = {
+                'found': self.scan_result.total_found,
+                'scanned': self.scan_result.total_scanned,
+                'time': self.scan_result.scan_time,
+                'timestamp': self.scan_result.timestamp
             }
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                # orjson serializes dataclasses natively, no asdict() copies
+                data = {'devices': self.scan_result.devices, 'stats': stats}
+                with open(path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+                    ))
+            else:
+                data = {
+                    'devices': [d.to_dict() for d in self.scan_result.devices],
+                    'stats': stats
+                }
+                with open(path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER) as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
             logger.info(f"Exported to JSON: {path}")
         except Exception as e:
             logger.error(f"JSON export error: {e}")
@@ -462,24 +831,80 @@ class ADBScanner:
     def export_csv(self, path: str):
         """Export to CSV"""
         try:
-            with open(path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=['ip', 'port', 'device_type', 'status', 'device_id', 'timestamp']
-                )
-                writer.writeheader()
+            with open(path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER) as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDS)
                 for device in self.scan_result.devices:
-                    row = device.to_dict()
-                    writer.writerow(row)
+                    writer.writerow([getattr(device, k) for k in CSV_FIELDS])
             logger.info(f"Exported to CSV: {path}")
         except Exception as e:
             logger.error(f"CSV export error: {e}")
 
 
+# ================================================================================
+# SCAN WORKER PROCESS
+# ================================================================================
+
+# Spawn everywhere: same behaviour on all platforms, and the child sets up
+# its own logging listener on import instead of inheriting a dead one
+MP_CONTEXT = mp.get_context('spawn')
+
+# Commands sent to the worker as (command, argument) tuples
+SCAN_START = 'start'
+SCAN_STOP = 'stop'
+
+def scan_worker(result_q, cmd_q):
+    """Long-lived scan process: one event loop, scans submitted via cmd_q"""
+    scanner = ADBScanner()
+    scanner.set_callback(
+        lambda message, progress=None, devices=None, hit=None:
+            result_q.put({'msg': message, 'progress': progress, 'devices': devices, 'hit': hit})
+    )
+    loop = new_scan_loop()
+    
+    async def run_scan(settings: ScanSettings):
+        try:
+            await scanner.scan_async(settings)
+        except Exception as e:
+            logger.error(f"Scan process error: {e}")
+            result_q.put({'msg': f"[ERROR] {str(e)}", 'progress': None, 'devices': None, 'hit': None})
+        finally:
+            result_q.put({'result': scanner.scan_result})
+    
+    def read_commands():
+        while True:
+            cmd, arg = cmd_q.get()
+            if cmd == SCAN_START:
+                asyncio.run_coroutine_threadsafe(run_scan(arg), loop)
+            elif cmd == SCAN_STOP:
+                scanner.stop_scan()
+    
+    threading.Thread(target=read_commands, daemon=True).start()
+    loop.run_forever()
+
+
 # ================================================================================
 # FLET UI APPLICATION
 # ================================================================================
 
+# UI refresh period (seconds) and scan log length
+UI_TICK = 0.05
+LOG_MAX_LINES = 500
+
+# (epoch second, "HH:MM:SS") of the last formatted log timestamp
+_ts_cache: Tuple[int, str] = (-1, "")
+
+def log_timestamp() -> str:
+    """Current time as HH:MM:SS, formatted at most once per second"""
+    global _ts_cache
+    now = time.time()
+    second = int(now)
+    cached = _ts_cache
+    if cached[0] != second:
+        cached = (second, time.strftime('%H:%M:%S', time.localtime(now)))
+        _ts_cache = cached
+    return cached[1]
+
 class ScannerApp:
     """Main application"""
     
@@ -488,21 +913,140 @@ class ScannerApp:
         self.settings = ScanSettings()
         self.scanner.set_callback(self._on_scan_update)
         self.scan_thread = None
-    
-    def _on_scan_update(self, message: str = "", progress: float = None, devices: int = None):
-        """Callback from scanner"""
-        if hasattr(self, 'log_text'):
-            current = self.log_text.value
-            ts = datetime.now().strftime('%H:%M:%S')
-            new_line = f"[{ts}] {message}\n"
-            self.log_text.value = current + new_line
-            # Auto-scroll removed - TextField doesn't have scroll_to in this Flet version
         
-        if progress is not None and hasattr(self, 'progress_bar'):
-            self.progress_bar.value = progress / 100
+        # Widgets, assigned in build()/_build_scan_tab()
+        self.page = None
+        self.log_text = None
+        self.progress_bar = None
+        self.devices_count = None
+        
+        # Scanner callbacks only record pending state; the UI ticker
+        # applies it to the widgets with one page.update() per tick
+        self._ui_lock = threading.Lock()
+        self._log_buf = collections.deque(maxlen=LOG_MAX_LINES)  # lines not shown yet
+        self._log_reset = False
+        self._pending_progress = None
+        self._pending_devices = None
+        self._ui_dirty = False
+        self._ui_ticker = None
+        
+        # Scan worker process (started on first scan, then reused)
+        self._scan_proc = None
+        self._cmd_q = None
+        self._result_q = None
+        self._scan_running = False
         
-        if devices is not None and hasattr(self, 'devices_count'):
-            self.devices_count.value = f"Found: {devices} devices"
+        # Results tab: devices of the current/last scan (hits stream in
+        # while it runs), the ones not rendered yet, and the render hook
+        self._result_devices: List[DeviceInfo] = []
+        self._pending_hits: List[DeviceInfo] = []
+        self._results_reset = False
+        self._update_results = None
+        self._rendered_keys: set = set()
+        self._tab_builders = {}
+    
+    def _ensure_scan_worker(self):
+        """Start the scan worker process if it is not running"""
+        if self._scan_proc is not None and self._scan_proc.is_alive():
+            return
+        self._result_q = MP_CONTEXT.Queue()
+        self._cmd_q = MP_CONTEXT.Queue()
+        self._scan_proc = MP_CONTEXT.Process(
+            target=scan_worker,
+            args=(self._result_q, self._cmd_q),
+            daemon=True
+        )
+        self._scan_proc.start()
+    
+    def _drain_scan_results(self, proc, result_q):
+        """Forward messages from the scan process until it reports a result"""
+        try:
+            while True:
+                try:
+                    item = result_q.get(timeout=1.0)
+                except queue.Empty:
+                    if not proc.is_alive():
+                        logger.error("Scan process exited without result")
+                        self._on_scan_update("[ERROR] Scan process exited unexpectedly")
+                        return
+                    continue
+                
+                if 'result' in item:
+                    result = item['result']
+                    self.scanner.scan_result = result
+                    with self._ui_lock:
+                        # Already-streamed hits are skipped when rendering
+                        self._result_devices = list(result.devices)
+                        self._pending_hits.extend(result.devices)
+                        self._ui_dirty = True
+                    return
+                self._on_scan_update(item['msg'], item['progress'], item['devices'], item['hit'])
+        finally:
+            self._scan_running = False
+    
+    def _on_scan_update(self, message: str = "", progress: float = None, devices: int = None,
+                        hit: Optional[DeviceInfo] = None):
+        """Callback from scanner"""
+        ts = log_timestamp()
+        with self._ui_lock:
+            self._log_buf.append(f"[{ts}] {message}")
+            if progress is not None:
+                self._pending_progress = progress
+            if devices is not None:
+                self._pending_devices = devices
+            if hit is not None:
+                self._result_devices.append(hit)
+                self._pending_hits.append(hit)
+            self._ui_dirty = True
+    
+    def _flush_ui_loop(self):
+        """Apply buffered UI changes with one page.update() per tick"""
+        while True:
+            time.sleep(UI_TICK)
+            with self._ui_lock:
+                if not self._ui_dirty or self.log_text is None:
+                    continue
+                self._ui_dirty = False
+                lines = list(self._log_buf)
+                self._log_buf.clear()
+                reset, self._log_reset = self._log_reset, False
+                progress, self._pending_progress = self._pending_progress, None
+                devices, self._pending_devices = self._pending_devices, None
+                hits, self._pending_hits = self._pending_hits, []
+                results_reset, self._results_reset = self._results_reset, False
+            
+            try:
+                # Append new rows only, keep at most LOG_MAX_LINES
+                rows = self.log_text.controls
+                if reset:
+                    rows.clear()
+                rows.extend(ft.Text(line, size=10, selectable=True) for line in lines)
+                overflow = len(rows) - LOG_MAX_LINES
+                if overflow > 0:
+                    del rows[:overflow]
+                if progress is not None:
+                    self.progress_bar.value = progress / 100
+                if devices is not None:
+                    self.devices_count.value = f"Found: {devices} devices"
+                if self._update_results is not None and (hits or results_reset):
+                    self._update_results(hits, results_reset)
+                self.page.update()
+            except Exception as e:
+                logger.debug(f"UI flush failed: {e}")
+    
+    def _on_tab_change(self, e):
+        """Build a tab's content the first time it is selected"""
+        index = int(e.control.selected_index)
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        e.control.tabs[index].content = builder()
+        self.page.update()
+        if index == 2:
+            # Render what the scan found so far on the next tick
+            with self._ui_lock:
+                self._pending_hits.extend(self._result_devices)
+                self._ui_dirty = True
     
     def _build_settings_tab(self) -> ft.Control:
         """Settings tab"""
@@ -559,6 +1103,7 @@ class ScannerApp:
         scan_ssh_check = ft.Checkbox(label="Scan SSH", value=self.settings.scan_ssh)
         scan_telnet_check = ft.Checkbox(label="Scan Telnet", value=self.settings.scan_telnet)
         skip_ping_check = ft.Checkbox(label="Skip Ping check", value=self.settings.skip_ping)
+        pre_sweep_check = ft.Checkbox(label="Pre-sweep live hosts", value=self.settings.pre_sweep)
         
         profile_dropdown = ft.Dropdown(
             label="Scan Profile",
@@ -575,19 +1120,22 @@ class ScannerApp:
         
         def apply_profile(name: str):
             """Apply preset profile"""
-            profiles = {
-                "lightning": ScanSettings(threads=200, timeout=0.3, port_end=5555),
-                "quick": ScanSettings(threads=100, timeout=0.5, port_end=5555),
-                "balanced": ScanSettings(threads=50, timeout=1.0, port_end=5555),
-                "deep": ScanSettings(threads=30, timeout=2.0, port_end=65535),
-                "paranoid": ScanSettings(threads=10, timeout=5.0, port_end=65535, retry_count=3)
-            }
-            if name in profiles:
-                prof = profiles[name]
-                timeout_field.value = str(prof.timeout)
-                threads_slider.value = prof.threads
-                port_end_field.value = str(prof.port_end)
-                self.page.update()
+            if name in SCAN_PROFILES:
+                threads, timeout, port_end = SCAN_PROFILES[name]
+                changed = False
+                if timeout_field.value != str(timeout):
+                    timeout_field.value = str(timeout)
+                    changed = True
+                if threads_slider.value != threads:
+                    threads_slider.value = threads
+                    changed = True
+                if port_end_field.value != str(port_end):
+                    port_end_field.value = str(port_end)
+                    changed = True
+                if changed:
+                    # Picked up by the next UI tick
+                    with self._ui_lock:
+                        self._ui_dirty = True
         
         profile_dropdown.on_change = lambda e: apply_profile(profile_dropdown.value)
         
@@ -605,6 +1153,7 @@ class ScannerApp:
                 self.settings.scan_ssh = scan_ssh_check.value
                 self.settings.scan_telnet = scan_telnet_check.value
                 self.settings.skip_ping = skip_ping_check.value
+                self.settings.pre_sweep = pre_sweep_check.value
                 self.settings.profile = profile_dropdown.value
                 
                 # Validate
@@ -647,7 +1196,7 @@ class ScannerApp:
                 ft.Divider(height=20),
                 ft.Text("PARAMETERS", size=16, weight="bold"),
                 ft.Row([timeout_field, ft.Text("sec")]),
-                ft.Text("Concurrent threads:"),
+                ft.Text("Max concurrent probes (auto-tuned below this):"),
                 threads_slider,
                 
                 ft.Divider(height=20),
@@ -656,6 +1205,7 @@ class ScannerApp:
                 scan_ssh_check,
                 scan_telnet_check,
                 skip_ping_check,
+                pre_sweep_check,
                 
                 ft.Divider(height=20),
                 ft.Text("PROFILES", size=16, weight="bold"),
@@ -676,12 +1226,11 @@ class ScannerApp:
     def _build_scan_tab(self) -> ft.Control:
         """Scan tab"""
         
-        self.log_text = ft.TextField(
-            multiline=True,
-            min_lines=15,
-            read_only=True,
-            value="[WAITING FOR SCAN]\n",
-            text_size=10
+        self.log_text = ft.ListView(
+            controls=[ft.Text("[WAITING FOR SCAN]", size=10, selectable=True)],
+            height=300,
+            spacing=0,
+            auto_scroll=True
         )
         
         self.progress_bar = ft.ProgressBar(value=0, width=500)
@@ -689,34 +1238,46 @@ class ScannerApp:
         
         def start_scan():
             """Start scan"""
-            if not self.scanner.is_scanning:
-                self.log_text.value = "[SCAN STARTED]\n"
-                self.progress_bar.value = 0
-                self.devices_count.value = "Found: 0 devices"
-                self.page.update()
+            if not self._scan_running:
+                with self._ui_lock:
+                    self._log_buf.clear()
+                    self._log_buf.append("[SCAN STARTED]")
+                    self._log_reset = True
+                    self._pending_progress = 0
+                    self._pending_devices = 0
+                    self._result_devices = []
+                    self._pending_hits = []
+                    self._results_reset = True
+                    self._ui_dirty = True
                 
-                def run_scan():
-                    try:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        loop.run_until_complete(self.scanner.scan_async(self.settings))
-                    except Exception as e:
-                        logger.error(f"Scan thread error: {e}")
-                        self._on_scan_update(f"[ERROR] {str(e)}")
+                # Scan runs in a child process: its probes don't share the
+                # GIL with the UI, and a crash there can't take the UI down
+                self._ensure_scan_worker()
+                self._scan_running = True
+                self._cmd_q.put((SCAN_START, self.settings))
                 
-                self.scan_thread = threading.Thread(target=run_scan, daemon=True)
+                self.scan_thread = threading.Thread(
+                    target=self._drain_scan_results,
+                    args=(self._scan_proc, self._result_q),
+                    daemon=True
+                )
                 self.scan_thread.start()
         
         def stop_scan():
             """Stop scan"""
-            self.scanner.stop_scan()
+            if self._scan_running:
+                self._cmd_q.put((SCAN_STOP, None))
         
         def export_results():
-            """Export results"""
+            """Export results (in background, UI stays responsive)"""
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            self.scanner.export_json(f'scan_result_{ts}.json')
-            self.scanner.export_csv(f'scan_result_{ts}.csv')
-            self._on_scan_update(f"[OK] Exported to scan_result_{ts}.*")
+            
+            def run_export():
+                self.scanner.export_json(f'scan_result_{ts}.json')
+                self.scanner.export_csv(f'scan_result_{ts}.csv')
+                self._on_scan_update(f"[OK] Exported to scan_result_{ts}.*")
+            
+            threading.Thread(target=run_export, daemon=True).start()
         
         start_btn = ft.ElevatedButton(
             text="START",
@@ -776,31 +1337,37 @@ class ScannerApp:
             auto_scroll=True
         )
         
-        def update_results():
-            """Update results list"""
-            results_list.controls.clear()
+        placeholder = ft.Text("No results. Run scan first.", color=ft.Colors.GREY_600)
+        results_list.controls.append(placeholder)
+        
+        def update_results(devices: List[DeviceInfo], reset: bool = False):
+            """Append cards for devices not rendered yet (called from the UI tick)"""
+            if reset:
+                # New scan: start over
+                self._rendered_keys.clear()
+                results_list.controls.clear()
+                results_list.controls.append(placeholder)
             
-            if not self.scanner.scan_result.devices:
+            for device in devices:
+                key = (device.ip, device.port)
+                if key in self._rendered_keys:
+                    continue
+                if not self._rendered_keys:
+                    results_list.controls.remove(placeholder)
+                self._rendered_keys.add(key)
                 results_list.controls.append(
-                    ft.Text("No results. Run scan first.", color=ft.Colors.GREY_600)
-                )
-            else:
-                for device in self.scanner.scan_result.devices:
-                    results_list.controls.append(
-                        ft.Card(
-                            content=ft.Container(
-                                content=ft.Column([
-                                    ft.Text(f"PC: {device.ip}:{device.port}", weight="bold", size=12),
-                                    ft.Text(f"Type: {device.device_type}", size=10, color=ft.Colors.BLUE_600),
-                                    ft.Text(f"Status: {device.status}", size=10),
-                                    ft.Text(device.timestamp, size=9, color=ft.Colors.GREY_600)
-                                ]),
-                                padding=10
-                            )
+                    ft.Card(
+                        content=ft.Container(
+                            content=ft.Column([
+                                ft.Text(f"PC: {device.ip}:{device.port}", weight="bold", size=12),
+                                ft.Text(f"Type: {device.device_type}", size=10, color=ft.Colors.BLUE_600),
+                                ft.Text(f"Status: {device.status}", size=10),
+                                ft.Text(device.timestamp, size=9, color=ft.Colors.GREY_600)
+                            ]),
+                            padding=10
                         )
                     )
-            
-            self.page.update()
+                )
         
         self._update_results = update_results
         
@@ -838,6 +1405,7 @@ class ScannerApp:
             )
         )
         
+        # Settings and Results are built on first selection
         tabs = ft.Tabs(
             selected_index=0,
             tabs=[
@@ -847,14 +1415,19 @@ class ScannerApp:
                 ),
                 ft.Tab(
                     text="SETTINGS",
-                    content=self._build_settings_tab()
+                    content=ft.Container()
                 ),
                 ft.Tab(
                     text="RESULTS",
-                    content=self._build_results_tab()
+                    content=ft.Container()
                 ),
-            ]
+            ],
+            on_change=self._on_tab_change
         )
+        self._tab_builders = {
+            1: self._build_settings_tab,
+            2: self._build_results_tab,
+        }
         
         page.add(
             ft.Column([
@@ -866,6 +1439,9 @@ class ScannerApp:
                 tabs
             ], expand=True)
         )
+        
+        self._ui_ticker = threading.Thread(target=self._flush_ui_loop, daemon=True)
+        self._ui_ticker.start()
 
 
 # ================================================================================
@@ -874,6 +1450,7 @@ class ScannerApp:
 
 def main():
     """Main function"""
+    mp.freeze_support()
     try:
         app = ScannerApp()
         ft.app(target=app.build)